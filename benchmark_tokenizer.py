@@ -0,0 +1,50 @@
+import re
+import timeit
+
+from modules.text_classifier import TextClassifier
+from modules.tokenizer import Tokenizer
+
+# Messages of different lengths, repeated as they would be in a chat
+short_msg = "I'm so happy!"
+medium_msg = "Today was an ordinary day, nothing special to report really."
+long_msg = " ".join([
+    "I'm feeling gloomy and a bit down after the results came in,",
+    "but honestly everything else is going as expected and I guess",
+    "tomorrow will be a regular day again."
+] * 4)
+
+messages = {
+    'short': short_msg,
+    'medium': medium_msg,
+    'long': long_msg
+}
+
+number = 5000
+
+
+def regex_tokenize(text):
+    # Tokenization as it was done before token ids were introduced
+    return re.findall(r'\b\w+\b', text.lower())
+
+
+def run(label, stmt):
+    seconds = timeit.timeit(stmt, number=number)
+    print(f"  {label:<24}{seconds / number * 1e6:8.2f} us/call")
+
+
+for name, text in messages.items():
+    print(f"{name} message ({len(regex_tokenize(text))} tokens)")
+
+    run("regex findall", lambda: regex_tokenize(text))
+
+    uncached = Tokenizer(cache_size=0)
+    uncached.intern_text(text)
+    run("tokenizer (no cache)", lambda: uncached.tokenize(text))
+
+    cached = Tokenizer()
+    cached.intern_text(text)
+    run("tokenizer (cached)", lambda: cached.tokenize(text))
+
+    classifier = TextClassifier()
+    run("classify", lambda: classifier.classify(text))
+
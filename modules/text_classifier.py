@@ -1,7 +1,8 @@
-import re
 import math
 from collections import defaultdict, Counter
 
+from modules.tokenizer import Tokenizer
+
 class TextClassifier:
     """
     A simple Naive Bayes text classifier for sentiment analysis.
@@ -9,6 +10,9 @@ class TextClassifier:
     """
     
     def __init__(self):
+        # Maps text to integer token ids; word counts below are keyed by id
+        self.tokenizer = Tokenizer()
+        
         # Initialize word counts for each class
         self.word_counts = {
             'happy': Counter(),
@@ -30,7 +34,8 @@ class TextClassifier:
             'sad': 0
         }
         
-        # Vocabulary size (for Laplace smoothing)
+        # Token ids seen in training, and their count (for Laplace smoothing)
+        self.vocab = set()
         self.vocab_size = 0
         
         # Train with some seed data
@@ -89,30 +94,24 @@ class TextClassifier:
         for text in sad_texts:
             self._update_counts(text, 'sad')
         
-        # Update vocabulary size
-        all_words = set()
-        for mood in self.word_counts:
-            all_words.update(self.word_counts[mood].keys())
-        self.vocab_size = len(all_words)
-    
     def _tokenize(self, text):
         """
         Convert text to lowercase and split into words.
         Remove punctuation and special characters.
+        Returns the words as a tuple of integer token ids, with words
+        not seen in training mapped to UNKNOWN_ID.
         """
-        text = text.lower()
-        # Replace punctuation with spaces and split into words
-        words = re.findall(r'\b\w+\b', text)
-        return words
+        return self.tokenizer.tokenize(text)
     
     def _update_counts(self, text, mood):
         """
-        Update word counts for a given text and mood.
+        Update word counts and vocabulary for a given text and mood.
         """
-        words = self._tokenize(text)
-        for word in words:
-            self.word_counts[mood][word] += 1
-            self.total_counts[mood] += 1
+        words = self.tokenizer.intern_text(text)
+        self.word_counts[mood].update(words)
+        self.total_counts[mood] += len(words)
+        self.vocab.update(words)
+        self.vocab_size = len(self.vocab)
     
     def classify(self, text):
         """
@@ -124,8 +123,23 @@ class TextClassifier:
         Using log probabilities to avoid underflow:
         log(P(Mood|Text)) = log(P(Text|Mood)) + log(P(Mood)) + constant
         """
-        words = self._tokenize(text)
-        
+        return self._classify_ids(self._tokenize(text))
+    
+    def classify_many(self, texts):
+        """
+        Classify a list of texts.
+        Returns one probability distribution per text.
+        """
+        return [
+            self._classify_ids(words)
+            for words in self.tokenizer.tokenize_many(texts)
+        ]
+    
+    def _classify_ids(self, words):
+        """
+        Compute the class distribution for a sequence of token ids.
+        UNKNOWN_ID has a count of 0 in every class.
+        """
         # Calculate log probabilities for each class
         log_probs = {}
         for mood in ['happy', 'neutral', 'sad']:
@@ -133,12 +147,11 @@ class TextClassifier:
             log_prob = math.log(self.class_priors[mood])
             
             # Add log probabilities of each word given the class (with Laplace smoothing)
+            # P(word|mood) = (count(word, mood) + 1) / (total_words_in_mood + vocab_size)
+            counts = self.word_counts[mood]
+            denominator = self.total_counts[mood] + self.vocab_size
             for word in words:
-                # P(word|mood) with Laplace smoothing
-                # (count(word, mood) + 1) / (total_words_in_mood + vocab_size)
-                word_count = self.word_counts[mood].get(word, 0)
-                word_prob = (word_count + 1) / (self.total_counts[mood] + self.vocab_size)
-                log_prob += math.log(word_prob)
+                log_prob += math.log((counts.get(word, 0) + 1) / denominator)
             
             log_probs[mood] = log_prob
         
@@ -165,10 +178,4 @@ class TextClassifier:
         """
         Update the classifier with new labeled data.
         """
-        self._update_counts(text, mood)
-        
-        # Update vocabulary size
-        all_words = set()
-        for m in self.word_counts:
-            all_words.update(self.word_counts[m].keys())
-        self.vocab_size = len(all_words) 
\ No newline at end of file
+        self._update_counts(text, mood) 
\ No newline at end of file
@@ -0,0 +1,86 @@
+import re
+import threading
+from collections import OrderedDict
+
+# Same tokens as r'\b\w+\b': a maximal run of word characters is always
+# bounded by \b on both sides, so the anchors are redundant.
+WORD_RE = re.compile(r'\w+')
+
+# Id returned for words that were never interned
+UNKNOWN_ID = -1
+
+
+class Tokenizer:
+    """
+    Tokenizer that maps text to tuples of integer token ids.
+
+    Words are interned (assigned a stable integer id) only through
+    intern_text, which is meant for training data. tokenize only looks
+    words up, mapping unseen ones to UNKNOWN_ID, so classifying arbitrary
+    user text does not grow the vocabulary. The id tuples of recently
+    tokenized messages are kept in a bounded LRU cache.
+    """
+
+    def __init__(self, cache_size=1024):
+        # Token string -> id, and id -> token string
+        self.token_ids = {}
+        self.tokens = []
+
+        # Message text -> tuple of token ids (most recently used last)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+        # Guards the cache and the vocabulary across request threads
+        self._lock = threading.Lock()
+
+    def intern_text(self, text):
+        """
+        Convert text to lowercase and return the ids of its words,
+        assigning new ids to unseen words.
+        """
+        words = WORD_RE.findall(text.lower())
+        with self._lock:
+            token_ids = self.token_ids
+            added = False
+            ids = []
+            for word in words:
+                token_id = token_ids.get(word)
+                if token_id is None:
+                    token_id = len(self.tokens)
+                    token_ids[word] = token_id
+                    self.tokens.append(word)
+                    added = True
+                ids.append(token_id)
+
+            # Cached messages may map the new words to UNKNOWN_ID
+            if added:
+                self._cache.clear()
+        return tuple(ids)
+
+    def tokenize(self, text):
+        """
+        Convert text to lowercase and return the ids of its words.
+        Punctuation and special characters are dropped, and words that
+        were never interned map to UNKNOWN_ID.
+        """
+        with self._lock:
+            ids = self._cache.get(text)
+            if ids is not None:
+                self._cache.move_to_end(text)
+                return ids
+
+        words = WORD_RE.findall(text.lower())
+        with self._lock:
+            token_ids = self.token_ids
+            ids = tuple([token_ids.get(word, UNKNOWN_ID) for word in words])
+            if self.cache_size > 0:
+                self._cache[text] = ids
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return ids
+
+    def tokenize_many(self, texts):
+        """
+        Tokenize a list of messages, returning one id tuple per message.
+        """
+        return [self.tokenize(text) for text in texts]
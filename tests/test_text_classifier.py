@@ -0,0 +1,98 @@
+import math
+import re
+from collections import Counter
+
+from modules.text_classifier import TextClassifier
+from modules.tokenizer import Tokenizer, UNKNOWN_ID
+
+MESSAGES = [
+    "I'm so happy!",
+    "What a terrible day.",
+    "It's an ordinary day.",
+    "Hello WORLD, unseen words here",
+    "",
+    "I'm so happy!",
+    "What a terrible day.",
+]
+
+
+def regex_classify(classifier, text):
+    """
+    Naive Bayes over string words, as classify worked before token ids.
+    """
+    words = re.findall(r'\b\w+\b', text.lower())
+    log_probs = {}
+    for mood in ['happy', 'neutral', 'sad']:
+        counts = Counter({
+            classifier.tokenizer.tokens[token_id]: count
+            for token_id, count in classifier.word_counts[mood].items()
+        })
+        log_prob = math.log(classifier.class_priors[mood])
+        for word in words:
+            word_prob = ((counts.get(word, 0) + 1) /
+                         (classifier.total_counts[mood] + classifier.vocab_size))
+            log_prob += math.log(word_prob)
+        log_probs[mood] = log_prob
+
+    max_log_prob = max(log_probs.values())
+    unnorm_probs = {
+        mood: math.exp(log_prob - max_log_prob)
+        for mood, log_prob in log_probs.items()
+    }
+    total = sum(unnorm_probs.values())
+    return {mood: prob / total for mood, prob in unnorm_probs.items()}
+
+
+def assert_close(actual, expected):
+    assert actual.keys() == expected.keys()
+    for mood in expected:
+        assert math.isclose(actual[mood], expected[mood], rel_tol=1e-12)
+
+
+def test_classify_matches_regex_baseline():
+    classifier = TextClassifier()
+    for text in MESSAGES:
+        assert_close(classifier.classify(text), regex_classify(classifier, text))
+
+
+def test_classify_many_matches_regex_baseline():
+    classifier = TextClassifier()
+    results = classifier.classify_many(MESSAGES)
+    assert len(results) == len(MESSAGES)
+    for text, probs in zip(MESSAGES, results):
+        assert_close(probs, regex_classify(classifier, text))
+
+
+def test_classify_does_not_grow_vocabulary():
+    classifier = TextClassifier()
+    vocab = len(classifier.tokenizer.tokens)
+    for i in range(100):
+        classifier.classify(f"random{i}")
+    assert len(classifier.tokenizer.tokens) == vocab
+    assert classifier.tokenizer.tokenize("random0") == (UNKNOWN_ID,)
+
+
+def test_update_sees_previously_cached_words():
+    classifier = TextClassifier()
+    text = "brandnewword"
+    classifier.classify(text)
+    classifier.update(text, 'happy')
+    assert UNKNOWN_ID not in classifier.tokenizer.tokenize(text)
+    assert_close(classifier.classify(text), regex_classify(classifier, text))
+
+
+def test_cache_evicts_least_recently_used():
+    tokenizer = Tokenizer(cache_size=2)
+    tokenizer.tokenize("a")
+    tokenizer.tokenize("b")
+    tokenizer.tokenize("a")
+    tokenizer.tokenize("c")
+    assert list(tokenizer._cache) == ["a", "c"]
+
+
+def test_cache_size_zero_disables_cache():
+    tokenizer = Tokenizer(cache_size=0)
+    tokenizer.intern_text("hello world")
+    assert tokenizer.tokenize("Hello, world!") == (0, 1)
+    assert tokenizer.tokenize_many(["hello", "world"]) == [(0,), (1,)]
+    assert len(tokenizer._cache) == 0